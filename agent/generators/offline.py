@@ -0,0 +1,678 @@
+from __future__ import annotations
+
+import ast
+import itertools
+import json
+import os
+import pathlib
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+# Seconds the worker may go without reporting a case (each case calls the target twice)
+# before it is considered hung; the import is timed separately
+_CASE_TIMEOUT = 2.0
+_IMPORT_TIMEOUT = 5.0
+# Overall wall-clock budget for probing one module
+_PROBE_BUDGET = 30.0
+_MAX_CASES = 40
+# Address-space cap for the worker on POSIX; CPU time is capped at the probe budget
+_MEMORY_LIMIT = 1024 * 1024 * 1024
+_MAX_CANDIDATES = 8
+
+# A type is (name, element type name or None), e.g. ("list", "int")
+TypeTag = Tuple[str, Optional[str]]
+
+_TYPE_NAMES = {
+    "int": "int",
+    "float": "float",
+    "bool": "bool",
+    "str": "str",
+    "bytes": "bytes",
+    "list": "list",
+    "List": "list",
+    "Sequence": "list",
+    "MutableSequence": "list",
+    "Iterable": "list",
+    "Collection": "list",
+    "tuple": "tuple",
+    "Tuple": "tuple",
+    "dict": "dict",
+    "Dict": "dict",
+    "Mapping": "dict",
+    "MutableMapping": "dict",
+    "set": "set",
+    "Set": "set",
+    "frozenset": "set",
+    "FrozenSet": "set",
+    "None": "none",
+    "NoneType": "none",
+}
+
+# First sample is the "typical" value used while other arguments are varied
+_SAMPLES: Dict[str, List[Any]] = {
+    "int": [3, 0, 1, -1, 100],
+    "float": [2.5, 0.0, 1.0, -1.5, 1e-09],
+    "bool": [True, False],
+    "str": ["abc", "", " ", "Hello, World"],
+    "bytes": [b"abc", b""],
+    "tuple": [(1, 2), ()],
+    "dict": [{"a": 1}, {}],
+    "set": [{1, 2}, set()],
+    "none": [None],
+}
+
+_STR_METHODS = {
+    "upper", "lower", "strip", "lstrip", "rstrip", "split", "rsplit", "join", "replace",
+    "startswith", "endswith", "find", "rfind", "format", "encode", "isdigit", "isalpha",
+    "isalnum", "isspace", "title", "capitalize", "casefold", "splitlines", "zfill",
+}
+_LIST_METHODS = {"append", "extend", "insert", "pop", "remove", "sort", "reverse", "index", "count"}
+_DICT_METHODS = {"items", "keys", "values", "get", "setdefault", "update"}
+_SET_METHODS = {"add", "discard", "union", "intersection", "difference", "issubset", "issuperset"}
+_SEQUENCE_BUILTINS = {"len", "sorted", "reversed", "sum", "min", "max", "enumerate", "any", "all"}
+# Outcomes that only say an argument had the wrong type; noise when that type was a guess
+_GUESS_NOISE = {"TypeError", "AttributeError", "OSError"}
+_EXCEPTION_REF = re.compile(r"[A-Za-z_]\w*(\.[A-Za-z_]\w*)?")
+# Only these variables reach the code under test; everything else may hold credentials
+_ENV_ALLOWLIST = {
+    "PATH", "PYTHONPATH", "PYTHONHOME", "PYTHONIOENCODING", "VIRTUAL_ENV", "HOME", "USERPROFILE",
+    "LANG", "LC_ALL", "LC_CTYPE", "TMPDIR", "TEMP", "TMP", "SYSTEMROOT", "SYSTEMDRIVE", "WINDIR", "COMSPEC",
+}
+
+_WORKER_SOURCE = '''
+import ast, contextlib, importlib, io, json, os, sys
+
+# Results go out on a high descriptor that the code under test is unlikely to hit
+_CHANNEL_FD = 511
+
+
+def _limit_resources(memory, cpu):
+    try:
+        import resource
+    except ImportError:  # not available on Windows
+        return
+    for limit, value in ((resource.RLIMIT_AS, memory), (resource.RLIMIT_CPU, cpu)):
+        try:
+            hard = resource.getrlimit(limit)[1]
+            value = value if hard == resource.RLIM_INFINITY else min(value, hard)
+            resource.setrlimit(limit, (value, value))
+        except (ValueError, OSError):
+            pass
+
+
+def _open_channel(out_path):
+    fd = os.open(out_path, os.O_WRONLY | os.O_APPEND | getattr(os, "O_BINARY", 0))
+    try:
+        import resource
+
+        soft = resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+        target = _CHANNEL_FD if soft == resource.RLIM_INFINITY else min(_CHANNEL_FD, soft - 1)
+        if target > fd:
+            channel = os.dup2(fd, target, inheritable=False)
+            os.close(fd)
+            return channel
+    except (ImportError, ValueError, OSError):
+        pass
+    return fd
+
+
+def _literal(value):
+    text = repr(value)
+    if len(text) > 200:
+        return None
+    try:
+        parsed = ast.literal_eval(text)
+    except Exception:
+        return None
+    if type(parsed) is not type(value) or parsed != value:
+        return None
+    return text
+
+
+def _exception(exc, module_name):
+    cls = type(exc)
+    if cls is MemoryError:
+        return None  # depends on the host, and replaying it would exhaust the test machine
+    if cls.__module__ == "builtins":
+        return cls.__name__
+    if cls.__module__ == module_name and "." not in cls.__qualname__:
+        return module_name + "." + cls.__qualname__
+    return None
+
+
+def main(module_name, plan_path, out_path, start, memory, cpu):
+    _limit_resources(memory, cpu)
+    with open(plan_path, encoding="utf-8") as fh:
+        plan = json.load(fh)
+    channel = _open_channel(out_path)
+
+    def emit(record):
+        os.write(channel, (json.dumps(record) + "\\n").encode("utf-8"))
+
+    sink = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(sink), contextlib.redirect_stderr(sink):
+            module = importlib.import_module(module_name)
+    except BaseException:
+        emit({"imported": False})
+        return
+    emit({"imported": True})
+    for index in range(start, len(plan)):
+        name, args_src = plan[index]
+        outcomes = []
+        for _ in range(2):
+            args = ast.literal_eval(args_src)
+            try:
+                with contextlib.redirect_stdout(sink), contextlib.redirect_stderr(sink):
+                    value = getattr(module, name)(*args)
+            except Exception as exc:
+                outcomes.append(("raises", _exception(exc, module_name)))
+            else:
+                outcomes.append(("returns", _literal(value)))
+            sink.seek(0)
+            sink.truncate()
+        record = {"index": index}
+        # Only keep deterministic, representable outcomes
+        if outcomes[0] == outcomes[1] and outcomes[0][1] is not None:
+            record["kind"], record["value"] = outcomes[0]
+        emit(record)
+
+
+main(sys.argv[1], sys.argv[2], sys.argv[3], *map(int, sys.argv[4:]))
+'''
+
+
+def _annotation_types(node: Optional[ast.AST]) -> List[TypeTag]:
+    if node is None:
+        return []
+    if isinstance(node, ast.Constant):
+        if node.value is None:
+            return [("none", None)]
+        if isinstance(node.value, str):
+            try:
+                return _annotation_types(ast.parse(node.value, mode="eval").body)
+            except SyntaxError:
+                return []
+        return []
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+        return _annotation_types(node.left) + _annotation_types(node.right)
+    if isinstance(node, ast.Name):
+        name = _TYPE_NAMES.get(node.id)
+        return [(name, None)] if name else []
+    if isinstance(node, ast.Attribute):
+        name = _TYPE_NAMES.get(node.attr)
+        return [(name, None)] if name else []
+    if isinstance(node, ast.Subscript):
+        base = node.value
+        base_name = base.attr if isinstance(base, ast.Attribute) else getattr(base, "id", "")
+        inner = node.slice
+        if isinstance(inner, ast.Index):  # pragma: no cover - Python < 3.9
+            inner = inner.value  # type: ignore[attr-defined]
+        elements = list(inner.elts) if isinstance(inner, ast.Tuple) else [inner]
+        if base_name == "Optional":
+            return _annotation_types(elements[0]) + [("none", None)]
+        if base_name == "Union":
+            return [t for element in elements for t in _annotation_types(element)]
+        name = _TYPE_NAMES.get(base_name)
+        if not name:
+            return []
+        if name == "list":
+            element_types = _annotation_types(elements[0])
+            element = element_types[0][0] if element_types else None
+            return [(name, element if element in _SAMPLES else None)]
+        return [(name, None)]
+    return []
+
+
+def _docstring_types(docstring: Optional[str], arg: str) -> List[TypeTag]:
+    if not docstring:
+        return []
+    name = re.escape(arg)
+    patterns = [
+        rf":type\s+{name}\s*:\s*([^\n]+)",
+        rf":param\s+([^:\n]+?)\s+{name}\s*:",
+        rf"(?m)^\s*{name}\s*\(([^)]+)\)\s*:",
+        rf"(?m)^\s*{name}\s*:\s*([^\n]+)$",
+    ]
+    for pattern in patterns:
+        match = re.search(pattern, docstring)
+        if not match:
+            continue
+        text = re.sub(r",?\s*optional\s*$", "", match.group(1).strip())
+        text = re.sub(r"\s+or\s+", " | ", text)
+        try:
+            found = _annotation_types(ast.parse(text, mode="eval").body)
+        except SyntaxError:
+            found = []
+        if found:
+            return found
+    return []
+
+
+def _constant_type(value: Any) -> Optional[str]:
+    if value is None:
+        return "none"
+    name = type(value).__name__
+    return name if name in _SAMPLES else None
+
+
+def _usage_types(func: ast.FunctionDef, arg: str) -> Tuple[List[TypeTag], List[Any]]:
+    """Vote on the type of ``arg`` from how the body uses it; also collect compared constants."""
+    votes: Counter = Counter()
+    boundaries: List[Any] = []
+
+    def is_arg(node: ast.AST) -> bool:
+        return isinstance(node, ast.Name) and node.id == arg
+
+    for node in ast.walk(func):
+        if isinstance(node, ast.BinOp) and (is_arg(node.left) or is_arg(node.right)):
+            other = node.right if is_arg(node.left) else node.left
+            if isinstance(other, ast.Constant) and _constant_type(other.value) not in (None, "none"):
+                votes[_constant_type(other.value)] += 1
+            elif not isinstance(node.op, ast.Mod):
+                votes["int"] += 1
+        elif isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub) and is_arg(node.operand):
+            votes["int"] += 1
+        elif isinstance(node, ast.Compare):
+            operands = [node.left] + list(node.comparators)
+            if any(is_arg(o) for o in operands):
+                for other in operands:
+                    if isinstance(other, ast.Constant):
+                        kind = _constant_type(other.value)
+                        if kind:
+                            votes[kind] += 1
+                            if kind != "none":
+                                boundaries.append(other.value)
+        elif isinstance(node, ast.Call):
+            func_node = node.func
+            if isinstance(func_node, ast.Attribute) and is_arg(func_node.value):
+                if func_node.attr in _STR_METHODS:
+                    votes["str"] += 1
+                elif func_node.attr in _LIST_METHODS:
+                    votes["list"] += 1
+                elif func_node.attr in _DICT_METHODS:
+                    votes["dict"] += 1
+                elif func_node.attr in _SET_METHODS:
+                    votes["set"] += 1
+                elif func_node.attr == "decode":
+                    votes["bytes"] += 1
+            elif isinstance(func_node, ast.Name) and any(is_arg(a) for a in node.args):
+                if func_node.id == "range":
+                    votes["int"] += 1
+                elif func_node.id in _SEQUENCE_BUILTINS:
+                    votes["list"] += 1
+                elif func_node.id == "isinstance" and len(node.args) == 2:
+                    for tag in _annotation_types(node.args[1]) or [
+                        t for e in getattr(node.args[1], "elts", []) for t in _annotation_types(e)
+                    ]:
+                        votes[tag[0]] += 2
+        elif isinstance(node, (ast.For, ast.comprehension)) and is_arg(node.iter):
+            votes["list"] += 1
+        elif isinstance(node, ast.Subscript) and is_arg(node.value):
+            key = node.slice
+            if isinstance(key, ast.Constant) and isinstance(key.value, str):
+                votes["dict"] += 1
+            else:
+                votes["list"] += 1
+
+    # Numeric votes for int and float collapse into whichever is more specific
+    if votes["float"] and votes["int"]:
+        votes["float"] += votes.pop("int")
+    # None is only ever a secondary candidate; it would make a poor typical value
+    has_none = votes.pop("none", 0) > 0
+    ranked: List[TypeTag] = [(name, None) for name, _ in votes.most_common(2)]
+    if has_none:
+        ranked.append(("none", None))
+    return ranked, boundaries
+
+
+def _samples(tag: TypeTag) -> List[Any]:
+    name, element = tag
+    if name == "list":
+        items = _SAMPLES.get(element or "int", _SAMPLES["int"])
+        return [list(items[:3]), [], [items[0]]]
+    return list(_SAMPLES.get(name, []))
+
+
+def _boundary_values(tags: List[TypeTag], constants: List[Any]) -> List[Any]:
+    names = {name for name, _ in tags}
+    values: List[Any] = []
+    for c in constants:
+        if isinstance(c, bool):
+            continue
+        if isinstance(c, (int, float)) and names & {"int", "float"}:
+            cast = float if "float" in names and "int" not in names else type(c)
+            values.extend(cast(v) for v in (c, c - 1, c + 1))
+        elif isinstance(c, str) and "str" in names:
+            values.append(c)
+    return values
+
+
+def _candidates(
+    func: ast.FunctionDef, arg: ast.arg, default: Optional[ast.expr]
+) -> Optional[Tuple[List[Any], bool]]:
+    """Return sample values for ``arg`` and whether its type was a bare int guess.
+
+    ``None`` means the argument is annotated with a type we cannot build values for.
+    """
+    annotated = _annotation_types(arg.annotation)
+    if arg.annotation is not None and not [t for t in annotated if t[0] != "none"]:
+        return None
+
+    default_value: List[Any] = []
+    default_types: List[TypeTag] = []
+    if default is not None:
+        try:
+            value = ast.literal_eval(default)
+        except Exception:
+            value = None
+        else:
+            default_value.append(value)
+            kind = _constant_type(value)
+            if kind:
+                default_types.append((kind, None))
+
+    usage, constants = _usage_types(func, arg.arg)
+    tags = (
+        annotated
+        or _docstring_types(ast.get_docstring(func), arg.arg)
+        or [t for t in default_types if t[0] != "none"] + usage
+    )
+    guessed = not tags
+    if guessed:
+        tags = [("int", None)]
+    if ("none", None) in default_types and ("none", None) not in tags:
+        tags.append(("none", None))
+
+    values = default_value + _boundary_values(tags, constants)
+    for tag in tags:
+        values.extend(_samples(tag))
+
+    unique: List[Any] = []
+    seen = set()
+    for value in values:
+        key = (type(value), repr(value))
+        if key not in seen:
+            seen.add(key)
+            unique.append(value)
+    return unique[:_MAX_CANDIDATES], guessed
+
+
+def _plan_cases(columns: List[List[Any]]) -> List[Tuple[Any, ...]]:
+    if not columns:
+        return [()]
+    total = 1
+    for values in columns:
+        total *= len(values)
+    if total <= _MAX_CASES:
+        return list(itertools.product(*columns))
+    # Vary one argument at a time around the typical values
+    base = [values[0] for values in columns]
+    cases = [tuple(base)]
+    for i, values in enumerate(columns):
+        for value in values[1:]:
+            case = list(base)
+            case[i] = value
+            cases.append(tuple(case))
+    return cases[:_MAX_CASES]
+
+
+def _probeable_functions(tree: ast.Module) -> List[Tuple[ast.FunctionDef, List[ast.arg], List[Optional[ast.expr]]]]:
+    found: Dict[str, Tuple[ast.FunctionDef, List[ast.arg], List[Optional[ast.expr]]]] = {}
+    for node in tree.body:
+        if not isinstance(node, ast.FunctionDef) or node.name.startswith("__"):
+            continue
+        # Only the last definition of a name is what the module exposes (overload stubs, redefinitions)
+        found.pop(node.name, None)
+        if any(d is None for d in node.args.kw_defaults):
+            continue  # required keyword-only arguments cannot be passed positionally
+        params = list(getattr(node.args, "posonlyargs", [])) + list(node.args.args)
+        defaults: List[Optional[ast.expr]] = [None] * (len(params) - len(node.args.defaults))
+        defaults += list(node.args.defaults)
+        found[node.name] = (node, params, defaults)
+    return list(found.values())
+
+
+def _read_records(out_file: pathlib.Path, offset: int) -> Tuple[List[Dict[str, Any]], int]:
+    """Parse the complete lines written after ``offset``; returns the records and the new offset."""
+    data = out_file.read_bytes()[offset:]
+    # The last line may still be mid-write; only complete lines are consumed
+    end = data.rfind(b"\n") + 1
+    records: List[Dict[str, Any]] = []
+    for line in data[:end].split(b"\n"):
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue  # blank, or bytes the code under test managed to write into the channel
+        if isinstance(record, dict):
+            records.append(record)
+    return records, offset + end
+
+
+def _valid_record(record: Dict[str, Any], plan_size: int) -> bool:
+    index = record.get("index")
+    if not isinstance(index, int) or isinstance(index, bool) or not 0 <= index < plan_size:
+        return False
+    if "kind" not in record:
+        return True
+    value = record.get("value")
+    if not isinstance(value, str):
+        return False
+    if record["kind"] == "raises":
+        return _EXCEPTION_REF.fullmatch(value) is not None
+    if record["kind"] == "returns":
+        try:
+            ast.literal_eval(value)
+        except Exception:
+            return False
+        return True
+    return False
+
+
+def _stop(proc: subprocess.Popen) -> None:
+    if proc.poll() is None:
+        proc.kill()
+        proc.wait()
+
+
+def _run_worker(
+    source_code: str, module_name: str, plan: List[List[str]], timeout: float, deadline: float
+) -> Dict[int, Dict[str, Any]]:
+    results: Dict[int, Dict[str, Any]] = {}
+    env = {k: v for k, v in os.environ.items() if k.upper() in _ENV_ALLOWLIST}
+    cpu_limit = max(1, int(deadline - time.monotonic()) + 1)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = pathlib.Path(temp_dir)
+        (temp_path / f"{module_name}.py").write_text(source_code, encoding="utf-8")
+        worker = temp_path / "_tcg_probe_worker.py"
+        worker.write_text(_WORKER_SOURCE, encoding="utf-8")
+        plan_file = temp_path / "plan.json"
+        plan_file.write_text(json.dumps(plan), encoding="utf-8")
+        out_file = temp_path / "results.jsonl"
+        out_file.touch()
+
+        offset = 0
+        start = 0
+        while start < len(plan) and time.monotonic() < deadline:
+            proc = subprocess.Popen(
+                [
+                    sys.executable,
+                    str(worker),
+                    module_name,
+                    str(plan_file),
+                    str(out_file),
+                    str(start),
+                    str(_MEMORY_LIMIT),
+                    str(cpu_limit),
+                ],
+                cwd=temp_path,
+                env=env,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            imported: Optional[bool] = None
+            hung = False
+            launched = last_progress = time.monotonic()
+            while True:
+                finished = proc.poll() is not None
+                records, offset = _read_records(out_file, offset)
+                for record in records:
+                    if "imported" in record:
+                        imported = bool(record["imported"])
+                        last_progress = time.monotonic()
+                    elif _valid_record(record, len(plan)):
+                        results[record["index"]] = record
+                        last_progress = time.monotonic()
+                now = time.monotonic()
+                if finished or imported is False or now > deadline:
+                    break
+                if imported is None and now - launched > _IMPORT_TIMEOUT:
+                    break
+                if imported and now - last_progress > timeout:
+                    hung = True
+                    break
+                time.sleep(0.01)
+            _stop(proc)
+            if not imported:
+                return {}  # the module failed, hung or died while importing
+
+            done = [i for i in results if i >= start]
+            resume = max(done) + 1 if done else start
+            if resume >= len(plan):
+                break
+            # Skip the case that ended the worker early; after a hang, skip the rest of that
+            # function too, since its neighbouring inputs tend to hang the same way
+            start = resume + 1
+            if hung:
+                while start < len(plan) and plan[start][0] == plan[resume][0]:
+                    start += 1
+    return results
+
+
+def _approximate(value: Any) -> bool:
+    if isinstance(value, float):
+        return True
+    if isinstance(value, dict):
+        items = list(value.values())
+    elif isinstance(value, (list, tuple)):
+        items = list(value)
+    else:
+        return False
+    # pytest.approx only takes flat containers of numbers
+    return any(type(v) is float for v in items) and all(type(v) in (int, float) for v in items)
+
+
+def _expected_cell(text: str) -> str:
+    # Float results may differ in the last digit across platforms and libm versions
+    return f"pytest.approx({text})" if _approximate(ast.literal_eval(text)) else text
+
+
+def _column_names(params: List[str], module_name: str) -> List[str]:
+    # "request" is a pytest fixture name and may not be used as a parametrize argname
+    reserved = {module_name, "pytest", "request", "expected", "exc"}
+    taken = set(params) | reserved
+    columns: List[str] = []
+    for p in params:
+        column = p
+        if p in reserved:
+            while column in taken:
+                column += "_"
+            taken.add(column)
+        columns.append(column)
+    return columns
+
+
+def _render_table(
+    module_name: str, name: str, suffix: str, columns: List[str], result_column: str, rows: List[List[str]]
+) -> List[str]:
+    lines: List[str] = []
+    all_columns = columns + [result_column]
+    lines.append("@pytest.mark.parametrize(")
+    lines.append(f'    "{", ".join(all_columns)}",')
+    lines.append("    [")
+    for row in rows:
+        rendered = ", ".join(row)
+        lines.append(f"        ({rendered})," if len(row) > 1 else f"        {rendered},")
+    lines.append("    ],")
+    lines.append(")")
+    lines.append(f"def test_{name}_{suffix}({', '.join(all_columns)}):")
+    call = f"{module_name}.{name}({', '.join(columns)})"
+    if suffix == "raises":
+        lines.append(f"    with pytest.raises({result_column}):")
+        lines.append(f"        {call}")
+    else:
+        lines.append(f"    assert {call} == {result_column}")
+    lines.append("")
+    return lines
+
+
+def build_regression_tables(
+    source_code: str, module_name: str, timeout: float = _CASE_TIMEOUT, budget: float = _PROBE_BUDGET
+) -> Dict[str, str]:
+    """Probe top-level functions with inferred boundary inputs and render parametrized tests.
+
+    Returns a mapping of function name to test source; functions without any
+    recorded outcome are left out so callers can fall back to smoke tests.
+    Any failure while probing yields an empty mapping.
+    """
+    try:
+        return _build_regression_tables(source_code, module_name, timeout, time.monotonic() + budget)
+    except Exception:
+        return {}
+
+
+def _build_regression_tables(source_code: str, module_name: str, timeout: float, deadline: float) -> Dict[str, str]:
+    try:
+        tree = ast.parse(source_code)
+    except SyntaxError:
+        return {}
+
+    plan: List[List[str]] = []
+    cases_by_function: Dict[str, List[Tuple[int, Tuple[Any, ...]]]] = {}
+    params_by_function: Dict[str, List[str]] = {}
+    guessed_functions = set()
+    for func, params, defaults in _probeable_functions(tree):
+        candidates = [_candidates(func, arg, default) for arg, default in zip(params, defaults)]
+        if any(c is None for c in candidates):
+            continue  # leave it to the smoke test rather than feed it made-up values
+        columns = [values for values, _ in candidates]
+        if any(guessed for _, guessed in candidates):
+            guessed_functions.add(func.name)
+        params_by_function[func.name] = [arg.arg for arg in params]
+        cases = cases_by_function.setdefault(func.name, [])
+        for case in _plan_cases(columns):
+            cases.append((len(plan), case))
+            plan.append([func.name, repr(tuple(case))])
+    if not plan:
+        return {}
+
+    results = _run_worker(source_code, module_name, plan, timeout, deadline)
+    tables: Dict[str, str] = {}
+    for name, cases in cases_by_function.items():
+        returns: List[List[str]] = []
+        raises: List[List[str]] = []
+        for index, case in cases:
+            record = results.get(index, {})
+            row = [repr(value) for value in case]
+            if record.get("kind") == "returns":
+                returns.append(row + [_expected_cell(record["value"])])
+            elif record.get("kind") == "raises":
+                if name in guessed_functions and record["value"] in _GUESS_NOISE:
+                    continue
+                raises.append(row + [record["value"]])
+        if not returns and not raises:
+            continue
+        columns = _column_names(params_by_function[name], module_name)
+        lines: List[str] = []
+        if returns:
+            lines.extend(_render_table(module_name, name, "regression", columns, "expected", returns))
+        if raises:
+            lines.extend(_render_table(module_name, name, "raises", columns, "exc", raises))
+        tables[name] = "\n".join(lines).rstrip("\n")
+    return tables
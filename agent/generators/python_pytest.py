@@ -1,4 +1,5 @@
 from agent.analysis import summarize_python
+from agent.generators.offline import build_regression_tables
 import re
 from typing import Dict, Any, List
 
@@ -29,7 +30,7 @@ def _sanitize_tests(text: str, module_name: str) -> str:
     return code.strip()
 
 
-def _simple_fallback_tests(summary: Dict[str, Any], module_name: str) -> str:
+def _simple_fallback_tests(summary: Dict[str, Any], module_name: str, source_code: str = "") -> str:
     functions: List[Dict[str, Any]] = summary.get("functions", [])
     has_top_level_input: bool = bool(summary.get("has_top_level_input"))
     lines: List[str] = []
@@ -44,8 +45,19 @@ def _simple_fallback_tests(summary: Dict[str, Any], module_name: str) -> str:
         lines.append("    captured = capsys.readouterr()")
         lines.append("    assert captured.out.strip() != ''")
         lines.append("")
+    tables: Dict[str, str] = {}
+    if source_code and functions and not has_top_level_input:
+        tables = build_regression_tables(source_code, module_name)
+    covered = set()
     for f in functions:
         name = f.get("name")
+        if name in covered:
+            continue  # redefined names appear more than once in the summary
+        if name in tables:
+            covered.add(name)
+            lines.append(tables[name])
+            lines.append("")
+            continue
         args = f.get("args", [])
         defaults = f.get("defaults", {})
         required = [a for a in args if a not in defaults]
@@ -103,7 +115,7 @@ def build_test_file(source_code: str, module_name: str, llm_generate) -> str:
             missing_ref = True
             break
     if missing_ref:
-        tests = _simple_fallback_tests(summary_dict, module_name)
+        tests = _simple_fallback_tests(summary_dict, module_name, source_code)
     if f"import {module_name}" not in tests and f"from {module_name}" not in tests:
         tests = f"import {module_name}\n\n" + tests
     return tests
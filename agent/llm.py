@@ -1,6 +1,8 @@
 import os
 from typing import Dict, Any, List
 
+from agent.generators.offline import build_regression_tables
+
 LAST_PROVIDER = "unknown"
 
 try:
@@ -14,7 +16,7 @@ except Exception:  # pragma: no cover
     genai = None  # type: ignore
 
 
-def _fallback_tests(summary: Dict[str, Any], module_name: str) -> str:
+def _fallback_tests(summary: Dict[str, Any], module_name: str, source_code: str = "") -> str:
     global LAST_PROVIDER
     LAST_PROVIDER = "fallback"
     functions: List[Dict[str, Any]] = summary.get("functions", [])
@@ -33,8 +35,20 @@ def _fallback_tests(summary: Dict[str, Any], module_name: str) -> str:
         lines.append("    captured = capsys.readouterr()")
         lines.append("    assert captured.out.strip() != ''")
         lines.append("")
+    # Probe the module offline for recorded regression tables; unprobed functions get smoke tests
+    tables: Dict[str, str] = {}
+    if source_code and functions and not has_top_level_input:
+        tables = build_regression_tables(source_code, module_name)
+    covered = set()
     for f in functions:
         name = f.get("name")
+        if name in covered:
+            continue  # redefined names appear more than once in the summary
+        if name in tables:
+            covered.add(name)
+            lines.append(tables[name])
+            lines.append("")
+            continue
         args = f.get("args", [])
         defaults = f.get("defaults", {})
         raises_list: List[str] = f.get("raises", [])
@@ -128,6 +142,6 @@ Output only a pytest test module contents that imports the module under test and
             pass  # fall through to local
 
     # 3) Fallback local tests
-    return _fallback_tests(summary, module_name)
+    return _fallback_tests(summary, module_name, source_code)
 
 
@@ -0,0 +1,215 @@
+import ast
+import pathlib
+import shutil
+import subprocess
+import sys
+import time
+
+import pytest
+
+from agent.generators import offline
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+EXAMPLES = pathlib.Path(__file__).resolve().parent.parent / "examples"
+
+
+def _function(source: str) -> ast.FunctionDef:
+    return ast.parse(source).body[0]
+
+
+def _annotation(text: str):
+    return offline._annotation_types(ast.parse(text, mode="eval").body)
+
+
+def test_annotation_types():
+    assert _annotation("int") == [("int", None)]
+    assert _annotation("Optional[str]") == [("str", None), ("none", None)]
+    assert _annotation("int | None") == [("int", None), ("none", None)]
+    assert _annotation("typing.List[float]") == [("list", "float")]
+    assert _annotation("'Dict[str, int]'") == [("dict", None)]
+    assert _annotation("Point") == []
+
+
+def test_docstring_types_sphinx():
+    doc = "Scale it.\n\n:param float factor: how much\n:type count: int\n"
+    assert offline._docstring_types(doc, "factor") == [("float", None)]
+    assert offline._docstring_types(doc, "count") == [("int", None)]
+
+
+def test_docstring_types_google():
+    doc = "Greet someone.\n\nArgs:\n    name (str): who to greet\n    title (str, optional): prefix\n"
+    assert offline._docstring_types(doc, "name") == [("str", None)]
+    assert offline._docstring_types(doc, "title") == [("str", None)]
+
+
+def test_docstring_types_numpy():
+    doc = "Sum.\n\nParameters\n----------\nvalues : list or None\n    the values\n"
+    assert offline._docstring_types(doc, "values") == [("list", None), ("none", None)]
+    assert offline._docstring_types("x: the thing to use", "x") == []
+
+
+def test_usage_types_voting():
+    func = _function(
+        "def f(text, items, score, mapping, opt):\n"
+        "    items.append(text.upper())\n"
+        "    if score >= 90 and opt is None:\n"
+        "        return mapping['key']\n"
+    )
+    assert offline._usage_types(func, "text")[0] == [("str", None)]
+    assert offline._usage_types(func, "items")[0] == [("list", None)]
+    assert offline._usage_types(func, "score") == ([("int", None)], [90])
+    assert offline._usage_types(func, "mapping")[0] == [("dict", None)]
+    assert offline._usage_types(func, "opt")[0] == [("none", None)]
+
+
+def test_candidates_skip_unknown_annotation_and_flag_guesses():
+    func = _function("def f(p: Point, q, r: int):\n    return p\n")
+    p, q, r = func.args.args
+    assert offline._candidates(func, p, None) is None
+    assert offline._candidates(func, q, None)[1] is True
+    assert offline._candidates(func, r, None)[1] is False
+
+
+def test_plan_cases_capping():
+    assert offline._plan_cases([]) == [()]
+    assert len(offline._plan_cases([[1, 2], [3, 4]])) == 4
+    wide = [list(range(8)) for _ in range(3)]
+    cases = offline._plan_cases(wide)
+    assert cases[0] == (0, 0, 0)
+    assert len(cases) == 1 + 3 * 7
+    many = [list(range(8)) for _ in range(10)]
+    assert len(offline._plan_cases(many)) == offline._MAX_CASES
+
+
+def test_run_worker_skips_rest_of_hanging_function():
+    source = "def f(n):\n    while n == 1:\n        pass\n    return n * 2\n\n\ndef g(n):\n    return n + 1\n"
+    plan = [["f", "(0,)"], ["f", "(1,)"], ["f", "(2,)"], ["g", "(2,)"]]
+    results = offline._run_worker(source, "mod", plan, 0.5, time.monotonic() + 30)
+    assert results[0]["value"] == "0"
+    assert 1 not in results and 2 not in results
+    assert results[3]["value"] == "3"
+
+
+def test_run_worker_skips_only_the_case_that_exits():
+    source = "def f(n):\n    if n == 1:\n        raise SystemExit(1)\n    return n * 2\n"
+    plan = [["f", "(0,)"], ["f", "(1,)"], ["f", "(2,)"]]
+    results = offline._run_worker(source, "mod", plan, 0.5, time.monotonic() + 30)
+    assert 1 not in results
+    assert results[2]["value"] == "4"
+
+
+def test_import_failure_returns_empty():
+    assert offline.build_regression_tables("raise RuntimeError\ndef f(a):\n    return a\n", "mod") == {}
+
+
+def test_hanging_import_is_aborted(monkeypatch):
+    monkeypatch.setattr(offline, "_IMPORT_TIMEOUT", 0.5)
+    started = time.monotonic()
+    assert offline.build_regression_tables("while True:\n    pass\ndef f(a):\n    return a\n", "mod") == {}
+    assert time.monotonic() - started < 5
+
+
+def test_read_records_skips_corrupted_lines(tmp_path):
+    out_file = tmp_path / "results.jsonl"
+    out_file.write_bytes(b'x{"index": 0}\n\xff\n[1]\n{"index": 1}\n{"index": 2')
+    records, offset = offline._read_records(out_file, 0)
+    assert records == [{"index": 1}]
+    assert offset == out_file.read_bytes().rfind(b"\n") + 1
+
+
+def test_code_writing_into_results_channel_does_not_crash():
+    source = (
+        "import sys\n"
+        "def corrupt(n: int):\n"
+        "    with open(sys.argv[3], 'a') as fh:\n"
+        "        fh.write('garbage\\n')\n"
+        "    return n\n"
+        "def write(path):\n"
+        "    open(path, 'w').write('x')\n"
+    )
+    tables = offline.build_regression_tables(source, "mod")
+    assert "test_corrupt_regression" in tables["corrupt"]
+    assert "OSError" not in tables.get("write", "")
+
+
+def test_float_results_use_approx():
+    tables = offline.build_regression_tables("def area(r: float):\n    return 3.14159 * r * r\n", "mod")
+    assert "pytest.approx(" in tables["area"]
+
+
+def test_end_to_end_math_utils(tmp_path):
+    source = (EXAMPLES / "math_utils.py").read_text(encoding="utf-8")
+    tables = offline.build_regression_tables(source, "math_utils")
+    assert set(tables) == {"add", "divide", "clamp"}
+    assert "ZeroDivisionError" in tables["divide"]
+
+    shutil.copy(EXAMPLES / "math_utils.py", tmp_path / "math_utils.py")
+    test_code = "import pytest\nimport math_utils\n\n\n" + "\n\n\n".join(tables.values()) + "\n"
+    (tmp_path / "test_math_utils.py").write_text(test_code, encoding="utf-8")
+    proc = subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider"],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+    )
+    assert proc.returncode == 0, proc.stdout + proc.stderr
+
+
+def test_column_names_avoid_reserved_and_clashes():
+    assert offline._column_names(["request"], "mod") == ["request_"]
+    assert offline._column_names(["expected", "expected_"], "mod") == ["expected__", "expected_"]
+    tables = offline.build_regression_tables("def handle(request):\n    return request\n", "mod")
+    assert '"request_, expected"' in tables["handle"]
+
+
+def test_only_last_definition_is_probed():
+    source = "def f(a: int):\n    return a\n\n\ndef f(a: int, b: int):\n    return a - b\n"
+    tables = offline.build_regression_tables(source, "mod")
+    assert '"a, b, expected"' in tables["f"]
+    assert "TypeError" not in tables["f"]
+
+
+def test_hanging_function_keeps_other_tables():
+    source = "def spin(n):\n    while n > 0:\n        pass\n    return n\n\n\ndef add(a, b):\n    return a + b\n"
+    started = time.monotonic()
+    tables = offline.build_regression_tables(source, "mod", timeout=0.5)
+    assert time.monotonic() - started < 5
+    assert "test_add_regression" in tables["add"]
+    assert "(0, 0)" in tables["spin"]
+
+
+def test_worker_environment_is_allowlisted(monkeypatch):
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "secret")
+    monkeypatch.setenv("GITHUB_TOKEN", "secret")
+    source = "import os\n\n\ndef leak(name: str):\n    return os.environ.get(name)\n"
+    tables = offline.build_regression_tables(source, "mod")
+    assert "secret" not in tables["leak"]
+
+
+@pytest.mark.skipif(resource is None, reason="resource limits are POSIX only")
+def test_memory_errors_are_not_recorded():
+    source = "def big(n: int):\n    return len([0] * n * 10**8)\n"
+    tables = offline.build_regression_tables(source, "mod")
+    assert "MemoryError" not in tables.get("big", "")
+
+
+@pytest.mark.skipif(resource is None, reason="resource limits are POSIX only")
+def test_low_open_file_limit(tmp_path):
+    script = (
+        "import resource, sys\n"
+        "resource.setrlimit(resource.RLIMIT_NOFILE, (256, resource.getrlimit(resource.RLIMIT_NOFILE)[1]))\n"
+        "from agent.generators import offline\n"
+        "source = open(sys.argv[1], encoding='utf-8').read()\n"
+        "print(sorted(offline.build_regression_tables(source, 'math_utils')))\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", script, str(EXAMPLES / "math_utils.py")],
+        cwd=EXAMPLES.parent,
+        capture_output=True,
+        text=True,
+    )
+    assert proc.stdout.strip() == "['add', 'clamp', 'divide']", proc.stderr